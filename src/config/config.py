@@ -1,10 +1,48 @@
 import os
+from pathlib import Path
 
 from dotenv import load_dotenv
 
-load_dotenv()
+ENV_FILE = Path(os.getenv(
+    "ENV_FILE", Path(__file__).resolve().parents[2] / ".env"))
+
+load_dotenv(ENV_FILE)
+
+
+def _env_list(name: str) -> list[str]:
+    return [item.strip() for item in os.getenv(name, "").split(",") if item.strip()]
+
+
+def _env_flag(name: str, default: str = "false") -> bool:
+    return os.getenv(name, default).strip().lower() in ("1", "true", "yes", "on")
 
 
 class Config:
+    DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./test.db")
+
     OPEN_WEATHER_API_KEY = os.getenv("OPEN_WEATHER_API_KEY")
     OPEN_WEATHER_API_URL = os.getenv("OPEN_WEATHER_API_URL")
+    OPEN_WEATHER_API_URLS = _env_list("OPEN_WEATHER_API_URLS")
+    OPEN_WEATHER_API_KEYS = _env_list("OPEN_WEATHER_API_KEYS")
+
+    UPSTREAM_TIMEOUT = float(os.getenv("UPSTREAM_TIMEOUT", "10"))
+    HEDGE_ENABLED = _env_flag("HEDGE_ENABLED", "true")
+    HEDGE_QUANTILE = float(os.getenv("HEDGE_QUANTILE", "0.95"))
+    HEDGE_MIN_DELAY = float(os.getenv("HEDGE_MIN_DELAY", "0.05"))
+    HEDGE_MAX_DELAY = float(os.getenv("HEDGE_MAX_DELAY", "2.0"))
+
+    WEATHER_FIELDS = _env_list("WEATHER_FIELDS")
+    WEATHER_CACHE_TTL = float(os.getenv("WEATHER_CACHE_TTL", "0"))
+
+    DB_INIT_ON_STARTUP = _env_flag("DB_INIT_ON_STARTUP", "true")
+    DB_WARM_CONNECTIONS = int(os.getenv("DB_WARM_CONNECTIONS", "1"))
+    WARM_UP_UPSTREAM = _env_flag("WARM_UP_UPSTREAM", "true")
+    PREWARM_WEATHER_CACHE = _env_flag("PREWARM_WEATHER_CACHE")
+    PREWARM_CONCURRENCY = int(os.getenv("PREWARM_CONCURRENCY", "10"))
+
+    DEBUG = _env_flag("DEBUG")
+    DIAGNOSTICS_ENABLED = _env_flag("DIAGNOSTICS_ENABLED")
+    ADMIN_TOKEN = os.getenv("ADMIN_TOKEN")
+    LOOP_LAG_INTERVAL = float(os.getenv("LOOP_LAG_INTERVAL", "0.5"))
+    SLOW_CALLBACK_THRESHOLD = float(os.getenv("SLOW_CALLBACK_THRESHOLD", "0.1"))
+    PROFILE_MAX_SECONDS = float(os.getenv("PROFILE_MAX_SECONDS", "30"))
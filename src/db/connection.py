@@ -1,9 +1,13 @@
-from sqlalchemy import MetaData, create_engine
+from contextlib import ExitStack
+
+from sqlalchemy import MetaData, create_engine, inspect, text
 from sqlalchemy.orm import sessionmaker
 
+from src.config.config import Config
+
 from .base import Base
 
-DATABASE_URL = "sqlite:///./test.db"
+DATABASE_URL = Config.DATABASE_URL
 
 engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -12,3 +16,15 @@ metadata = MetaData()
 
 def init_db():
     Base.metadata.create_all(bind=engine)
+
+
+def check_schema() -> list[str]:
+    existing_tables = set(inspect(engine).get_table_names())
+    return [table for table in Base.metadata.tables if table not in existing_tables]
+
+
+def warm_up_pool(connections: int = 1) -> None:
+    with ExitStack() as stack:
+        for _ in range(connections):
+            connection = stack.enter_context(engine.connect())
+            connection.execute(text("SELECT 1"))
@@ -0,0 +1,34 @@
+import sys
+
+from src.db.connection import SessionLocal, check_schema, init_db
+from src.models.models import WeatherData
+from src.services.services import reading_layout
+from src.utils.readings import is_legacy_readings, upgrade_legacy_readings
+
+
+def migrate_legacy_readings() -> int:
+    """Convert readings stored as JSON text to the binary layout."""
+    converted = 0
+    with SessionLocal() as database_session:
+        for record in database_session.query(WeatherData):
+            if record.data is not None and is_legacy_readings(record.data):
+                record.data = upgrade_legacy_readings(record.data, reading_layout)
+                converted += 1
+        database_session.commit()
+    return converted
+
+
+def main() -> int:
+    init_db()
+    missing_tables = check_schema()
+    if missing_tables:
+        print(f"Missing tables after migration: {', '.join(missing_tables)}")
+        return 1
+    converted = migrate_legacy_readings()
+    print(f"Converted {converted} legacy weather record(s) to the binary layout.")
+    print("Database schema is up to date.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,87 @@
+"""Cold-start benchmark of the application.
+
+Each run starts a fresh interpreter, imports ``src.main`` and runs its
+lifespan until ``/readyz`` would report ready, so the numbers match what a
+newly scaled-up worker pays before it can serve traffic::
+
+    python -m src.diagnostics.benchmark --runs 10
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+
+_PROBE = """
+import asyncio, json, sys, time
+started = time.perf_counter()
+from src.main import app
+imported = time.perf_counter()
+
+async def wait_until_ready():
+    deadline = time.perf_counter() + float(sys.argv[1])
+    async with app.router.lifespan_context(app):
+        while not all(app.state.readiness.values()):
+            if time.perf_counter() > deadline:
+                sys.exit(f"Not ready after {sys.argv[1]} s: {app.state.readiness}")
+            await asyncio.sleep(0.001)
+        return time.perf_counter()
+
+ready = asyncio.run(wait_until_ready())
+print(json.dumps({
+    "import_ms": (imported - started) * 1000,
+    "ready_ms": (ready - started) * 1000,
+}))
+"""
+
+
+def run_once(timeout: float = 60.0) -> dict[str, float]:
+    started = time.perf_counter()
+    try:
+        completed = subprocess.run(
+            [sys.executable, "-c", _PROBE, str(timeout)],
+            capture_output=True, text=True, check=True, timeout=timeout + 30)
+    except subprocess.CalledProcessError as e:
+        raise RuntimeError(f"Startup benchmark run failed: {e.stderr.strip()}") from e
+    timings = json.loads(completed.stdout.strip().splitlines()[-1])
+    timings["process_ms"] = (time.perf_counter() - started) * 1000
+    return timings
+
+
+def summarize(runs: list[dict[str, float]]) -> dict[str, dict[str, float]]:
+    summary = {}
+    for metric in runs[0]:
+        values = sorted(run[metric] for run in runs)
+        summary[metric] = {
+            "min": round(values[0], 1),
+            "median": round(statistics.median(values), 1),
+            "max": round(values[-1], 1),
+        }
+    return summary
+
+
+def main(argv: list[str] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--timeout", type=float, default=60.0,
+                        help="Seconds a run may take to become ready.")
+    parser.add_argument("--json", action="store_true",
+                        help="Print the summary as JSON.")
+    args = parser.parse_args(argv)
+
+    try:
+        summary = summarize([run_once(args.timeout) for _ in range(args.runs)])
+    except (RuntimeError, subprocess.TimeoutExpired) as e:
+        sys.exit(str(e))
+
+    if args.json:
+        print(json.dumps(summary))
+        return
+    print(f"{'metric':<12}{'min':>10}{'median':>10}{'max':>10}")
+    for metric, values in summary.items():
+        print(f"{metric:<12}{values['min']:>10}{values['median']:>10}{values['max']:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import Counter, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Iterator, Optional
+
+from fastapi import Request, Response
+
+logger = logging.getLogger(__name__)
+
+_request_timings: ContextVar[Optional[dict[str, float]]] = ContextVar(
+    "request_timings", default=None)
+
+
+@contextmanager
+def track(phase: str) -> Iterator[None]:
+    """Add the time spent in the block to ``phase`` for the current request.
+
+    Does nothing unless the Server-Timing middleware is collecting timings.
+    """
+    timings = _request_timings.get()
+    if timings is None:
+        yield
+        return
+
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[phase] = timings.get(phase, 0.0) + \
+            time.perf_counter() - started
+
+
+def format_server_timing(timings: dict[str, float]) -> str:
+    return ", ".join(
+        f"{phase};dur={seconds * 1000:.2f}" for phase, seconds in timings.items())
+
+
+async def server_timing_middleware(request: Request, call_next: Callable) -> Response:
+    timings: dict[str, float] = {}
+    token = _request_timings.set(timings)
+    started = time.perf_counter()
+    try:
+        response = await call_next(request)
+    finally:
+        _request_timings.reset(token)
+    timings["total"] = time.perf_counter() - started
+    response.headers["Server-Timing"] = format_server_timing(timings)
+    return response
+
+
+class LoopLagMonitor:
+    """Measures event-loop lag and reports callbacks that block the loop.
+
+    A heartbeat task sleeps for ``interval`` seconds and records how late it
+    wakes up. A watchdog thread checks the heartbeat from outside the loop, so
+    when a callback stalls the loop for longer than ``threshold`` it can log
+    the stack the loop thread is stuck in while it is still stuck.
+    """
+
+    def __init__(self, interval: float = 0.5, threshold: float = 0.1, history: int = 1024):
+        self.interval = interval
+        self.threshold = threshold
+        self.lags: deque[float] = deque(maxlen=history)
+        self.slow_callbacks = 0
+        self._last_beat = time.perf_counter()
+        self._loop_thread_id: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+
+    def start(self) -> None:
+        self._loop_thread_id = threading.get_ident()
+        self._last_beat = time.perf_counter()
+        self._stopped.clear()
+        self._task = asyncio.get_running_loop().create_task(self._heartbeat())
+        self._watchdog = threading.Thread(
+            target=self._watch, name="loop-lag-watchdog", daemon=True)
+        self._watchdog.start()
+
+    async def stop(self) -> None:
+        self._stopped.set()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._watchdog is not None:
+            self._watchdog.join(timeout=self.interval * 2)
+            self._watchdog = None
+
+    async def _heartbeat(self) -> None:
+        while True:
+            expected = time.perf_counter() + self.interval
+            await asyncio.sleep(self.interval)
+            now = time.perf_counter()
+            self.lags.append(max(0.0, now - expected))
+            self._last_beat = now
+
+    def _watch(self) -> None:
+        reported_beat = None
+        while not self._stopped.wait(min(self.interval, self.threshold) / 2):
+            beat = self._last_beat
+            stalled = time.perf_counter() - beat - self.interval
+            if stalled <= self.threshold or beat == reported_beat:
+                continue
+            reported_beat = beat
+            self.slow_callbacks += 1
+            frame = sys._current_frames().get(self._loop_thread_id)
+            stack = "".join(traceback.format_stack(frame)
+                            ) if frame else "<unavailable>\n"
+            logger.warning(
+                "Event loop blocked for %.0f ms, loop thread stack:\n%s",
+                stalled * 1000, stack)
+
+    def stats(self) -> dict[str, Any]:
+        lags = sorted(self.lags)
+        if not lags:
+            return {"samples": 0, "slow_callbacks": self.slow_callbacks}
+
+        def percentile(fraction: float) -> float:
+            return lags[min(len(lags) - 1, int(fraction * len(lags)))] * 1000
+
+        return {
+            "samples": len(lags),
+            "slow_callbacks": self.slow_callbacks,
+            "last_ms": round(self.lags[-1] * 1000, 3),
+            "p50_ms": round(percentile(0.50), 3),
+            "p99_ms": round(percentile(0.99), 3),
+            "max_ms": round(lags[-1] * 1000, 3),
+        }
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+def sample_stacks(duration: float, interval: float = 0.005) -> Counter:
+    """Sample the stack of every thread for ``duration`` seconds.
+
+    Returns a counter keyed by collapsed stacks (root first, frames joined by
+    ``;``), the input format of flamegraph.pl, speedscope and friends.
+    """
+    own_thread_id = threading.get_ident()
+    thread_names = {thread.ident: thread.name for thread in threading.enumerate()}
+    samples: Counter = Counter()
+    deadline = time.perf_counter() + duration
+
+    while time.perf_counter() < deadline:
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == own_thread_id:
+                continue
+            stack = []
+            while frame is not None:
+                stack.append(_frame_label(frame))
+                frame = frame.f_back
+            stack.append(thread_names.get(thread_id, str(thread_id)))
+            samples[";".join(reversed(stack))] += 1
+        time.sleep(interval)
+
+    return samples
+
+
+def render_folded(samples: Counter) -> str:
+    return "".join(f"{stack} {count}\n" for stack, count in sorted(samples.items()))
@@ -1,10 +1,94 @@
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager, suppress
+
 from fastapi import FastAPI
 
-from src.db.connection import init_db
+from src.config.config import Config
+from src.db.connection import check_schema, init_db, warm_up_pool
+from src.diagnostics.diagnostics import LoopLagMonitor, server_timing_middleware
+from src.routes.admin import router as admin_router
+from src.routes.health import router as health_router
 from src.routes.routes import router as weather_router
+from src.services.services import (
+    close_http_client,
+    open_http_client,
+    prewarm_weather_cache,
+    provider_pool,
+    weather_cache,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def prepare_database() -> bool:
+    if Config.DB_INIT_ON_STARTUP:
+        init_db()
+
+    missing_tables = check_schema()
+    if missing_tables:
+        logger.error("Database schema is missing tables: %s. Run `python -m src.db.migrate`.",
+                     ", ".join(missing_tables))
+        return False
+
+    warm_up_pool(Config.DB_WARM_CONNECTIONS)
+    return True
+
+
+async def warm_up(app: FastAPI, started: float) -> None:
+    try:
+        client = await open_http_client()
+        if Config.WARM_UP_UPSTREAM:
+            await provider_pool.warm_up(client)
+        app.state.readiness["upstream"] = True
+
+        if Config.PREWARM_WEATHER_CACHE and weather_cache.enabled:
+            app.state.startup["prewarmed_cities"] = await prewarm_weather_cache()
+        app.state.readiness["cache"] = True
+    except Exception as e:
+        logger.exception("Application warm-up failed.")
+        app.state.startup["error"] = f"Warm-up failed: {e}"
+        return
 
-init_db()
+    app.state.startup["ready_ms"] = round(
+        (time.perf_counter() - started) * 1000, 3)
+    logger.info("Application ready in %.1f ms.", app.state.startup["ready_ms"])
 
-app = FastAPI()
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    started = time.perf_counter()
+    app.state.startup = {}
+    app.state.readiness = {"database": False, "upstream": False, "cache": False}
+
+    monitor = None
+    if Config.DIAGNOSTICS_ENABLED:
+        monitor = LoopLagMonitor(
+            interval=Config.LOOP_LAG_INTERVAL, threshold=Config.SLOW_CALLBACK_THRESHOLD)
+        monitor.start()
+        app.state.loop_monitor = monitor
+
+    app.state.readiness["database"] = prepare_database()
+    warm_up_task = asyncio.create_task(warm_up(app, started))
+
+    yield
+
+    warm_up_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await warm_up_task
+    await close_http_client()
+    if monitor is not None:
+        await monitor.stop()
+
+
+app = FastAPI(lifespan=lifespan)
+
+app.include_router(health_router)
 app.include_router(weather_router)
+
+if Config.DIAGNOSTICS_ENABLED:
+    app.include_router(admin_router)
+
+if Config.DEBUG:
+    app.middleware("http")(server_timing_middleware)
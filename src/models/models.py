@@ -1,5 +1,5 @@
 from src.db.base import Base
-from sqlalchemy import JSON, Column, DateTime, String
+from sqlalchemy import Column, DateTime, LargeBinary, String
 
 
 class WeatherData(Base):
@@ -7,4 +7,4 @@ class WeatherData(Base):
 
     request_id = Column(String, primary_key=True, index=True)
     timestamp = Column(DateTime)
-    data = Column(JSON)
+    data = Column(LargeBinary)
@@ -0,0 +1,52 @@
+import asyncio
+import secrets
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request
+from fastapi.responses import PlainTextResponse
+
+from src.config.config import Config
+from src.diagnostics.diagnostics import render_folded, sample_stacks
+from src.services.services import provider_pool
+
+
+def require_admin_token(x_admin_token: Optional[str] = Header(None)) -> None:
+    if not Config.ADMIN_TOKEN:
+        raise HTTPException(
+            status_code=403, detail="Admin token is not configured.")
+    if x_admin_token is None or not secrets.compare_digest(x_admin_token, Config.ADMIN_TOKEN):
+        raise HTTPException(status_code=403, detail="Invalid admin token.")
+
+
+router = APIRouter(prefix="/admin", dependencies=[Depends(require_admin_token)])
+
+_profile_lock = asyncio.Lock()
+
+
+@router.get("/loop-lag")
+async def get_loop_lag(request: Request):
+    monitor = getattr(request.app.state, "loop_monitor", None)
+    if monitor is None:
+        raise HTTPException(
+            status_code=503, detail="Event loop monitor is not running.")
+    return monitor.stats()
+
+
+@router.get("/providers")
+async def get_providers():
+    return provider_pool.stats()
+
+
+@router.get("/profile", response_class=PlainTextResponse)
+async def profile(
+    seconds: float = Query(5.0, gt=0, le=Config.PROFILE_MAX_SECONDS),
+    interval_ms: float = Query(5.0, ge=1, le=1000),
+):
+    if _profile_lock.locked():
+        raise HTTPException(
+            status_code=409, detail="A profile is already running.")
+
+    async with _profile_lock:
+        samples = await asyncio.to_thread(sample_stacks, seconds, interval_ms / 1000)
+
+    return PlainTextResponse(render_folded(samples))
@@ -1,16 +1,23 @@
-import json
+from typing import Optional
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query, Response
 
 from src.db.connection import SessionLocal
+from src.diagnostics.diagnostics import track
 from src.models.models import WeatherData
 from src.schemas.schemas import (
     UserWeatherRequest,
     WeatherDataResponse,
     WeatherProgressResponse,
 )
-from src.services.services import get_and_save_weather_info
+from src.services.services import get_and_save_weather_info, reading_layout
 from src.utils.cities import CITIES_ID
+from src.utils.fields import DEFAULT_FIELDS
+from src.utils.readings import (
+    ReadingLayout,
+    parse_fields,
+    upgrade_legacy_readings,
+)
 
 router = APIRouter()
 
@@ -24,8 +31,9 @@ async def root():
 async def start_weather_data_collection(request: UserWeatherRequest):
     try:
         with SessionLocal() as db:
-            existing_user_record = db.query(WeatherData).filter(
-                WeatherData.request_id == request.request_id).first()
+            with track("db"):
+                existing_user_record = db.query(WeatherData).filter(
+                    WeatherData.request_id == request.request_id).first()
 
             if existing_user_record:
                 raise HTTPException(
@@ -46,34 +54,52 @@ async def start_weather_data_collection(request: UserWeatherRequest):
 
 
 @router.get("/weather/{request_id}", response_model=WeatherProgressResponse)
-async def get_weather_data(request_id: str):
+async def get_weather_data(
+    request_id: str,
+    fields: Optional[str] = Query(
+        None, description="Comma-separated reading fields to return."),
+):
     if not request_id.strip():
         raise HTTPException(
             status_code=422, detail="Request ID cannot be empty.")
 
+    try:
+        requested_fields = DEFAULT_FIELDS if fields is None else parse_fields(
+            fields.split(","))
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
     total_cities = len(CITIES_ID)
 
     try:
         with SessionLocal() as db:
-            weather_record = db.query(WeatherData).filter(
-                WeatherData.request_id == request_id).first()
+            with track("db"):
+                weather_record = db.query(WeatherData).filter(
+                    WeatherData.request_id == request_id).first()
 
             if not weather_record:
                 raise HTTPException(
                     status_code=404, detail="User ID cannot be found in the database.")
 
-            entries_count = len(json.loads(weather_record.data))
+            with track("serialization"):
+                stored_data = upgrade_legacy_readings(
+                    weather_record.data, reading_layout)
+                layout = ReadingLayout.from_blob(stored_data)
+                entries_count = layout.count(stored_data)
+                readings = layout.decode(stored_data, requested_fields)
 
             upload_progress = int((entries_count / total_cities) * 100)
 
-            result_data = {
-                "request_id": weather_record.request_id,
-                "timestamp": weather_record.timestamp,
-                "data": weather_record.data,
-                "upload_progress": f"{upload_progress}% uploaded..."
-            }
-
-            return result_data
+            # Validated and rendered here rather than by response_model so
+            # the Server-Timing serialization phase includes the JSON body.
+            with track("serialization"):
+                result_data = WeatherProgressResponse(
+                    request_id=weather_record.request_id,
+                    timestamp=weather_record.timestamp,
+                    data=readings,
+                    upload_progress=f"{upload_progress}% uploaded..."
+                )
+                return Response(result_data.model_dump_json(), media_type="application/json")
 
     except HTTPException as e:
         print(f"HTTPException occurred: {e.detail}")
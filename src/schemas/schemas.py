@@ -30,5 +30,5 @@ class UserWeatherData(BaseModel):
 class WeatherProgressResponse(BaseModel):
     request_id: str
     timestamp: datetime
-    data: str
+    data: list[dict[str, Any]]
     upload_progress: str
@@ -0,0 +1,218 @@
+import asyncio
+import time
+from collections import deque
+from typing import Any, Optional
+from urllib.parse import urlparse
+
+import httpx
+
+from src.config.config import Config
+
+
+class WeatherProvider:
+    """One upstream endpoint/API key pair and its observed latency and health."""
+
+    FAILURE_THRESHOLD = 3
+    COOLDOWN = 30.0
+    EWMA_WEIGHT = 0.2
+
+    def __init__(self, name: str, base_url: str, api_key: Optional[str], window: int = 200):
+        self.name = name
+        self.base_url = base_url
+        self.api_key = api_key
+        self.latencies: deque[float] = deque(maxlen=window)
+        self.ewma: Optional[float] = None
+        self.requests = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.unhealthy_until = 0.0
+
+    @property
+    def healthy(self) -> bool:
+        return self.consecutive_failures < self.FAILURE_THRESHOLD or \
+            time.monotonic() >= self.unhealthy_until
+
+    def _record_latency(self, latency: float) -> None:
+        self.latencies.append(latency)
+        self.ewma = latency if self.ewma is None else \
+            self.EWMA_WEIGHT * latency + (1 - self.EWMA_WEIGHT) * self.ewma
+
+    def record_success(self, latency: float) -> None:
+        self.requests += 1
+        self.consecutive_failures = 0
+        self._record_latency(latency)
+
+    def record_censored(self, elapsed: float) -> None:
+        """Record a request abandoned after ``elapsed`` seconds.
+
+        Its real latency is at least ``elapsed``, so counting that as a sample
+        lets a provider that has slowed down drop in the ranking.
+        """
+        self.requests += 1
+        self._record_latency(elapsed)
+
+    def record_failure(self) -> None:
+        self.requests += 1
+        self.failures += 1
+        self.consecutive_failures += 1
+        if self.consecutive_failures >= self.FAILURE_THRESHOLD:
+            self.unhealthy_until = time.monotonic() + self.COOLDOWN
+
+    def latency_quantile(self, quantile: float) -> Optional[float]:
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(quantile * len(ordered)))]
+
+    async def fetch(self, client: httpx.AsyncClient, city_id: int) -> dict[str, Any]:
+        started = time.perf_counter()
+        try:
+            weather_response = await client.get(
+                self.base_url,
+                params={
+                    "id": city_id,
+                    "appid": self.api_key,
+                    "units": "metric",
+                }
+            )
+            weather_response.raise_for_status()
+            weather_json = weather_response.json()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.record_failure()
+            raise
+        self.record_success(time.perf_counter() - started)
+        return weather_json
+
+    def stats(self) -> dict[str, Any]:
+        def to_ms(seconds: Optional[float]) -> Optional[float]:
+            return None if seconds is None else round(seconds * 1000, 3)
+
+        return {
+            "name": self.name,
+            "healthy": self.healthy,
+            "requests": self.requests,
+            "failures": self.failures,
+            "ewma_ms": to_ms(self.ewma),
+            "p50_ms": to_ms(self.latency_quantile(0.50)),
+            "p95_ms": to_ms(self.latency_quantile(0.95)),
+        }
+
+
+class ProviderPool:
+    """Routes requests to the fastest healthy provider and hedges slow ones.
+
+    When the primary has not answered after its observed latency quantile
+    (clamped to ``[min_delay, max_delay]``), a duplicate request goes to the
+    next provider and whichever answers first wins. A primary that loses the
+    race is charged the time it was waited on. A failed primary fails over to
+    the next provider straight away. With a single provider there is nothing
+    to hedge to, so requests are sent once.
+    """
+
+    MIN_SAMPLES = 10
+
+    def __init__(
+        self,
+        providers: list[WeatherProvider],
+        hedge_enabled: bool = True,
+        hedge_quantile: float = 0.95,
+        min_delay: float = 0.05,
+        max_delay: float = 2.0,
+    ):
+        if not providers:
+            raise ValueError("At least one weather provider is required.")
+        self.providers = providers
+        self.hedge_enabled = hedge_enabled
+        self.hedge_quantile = hedge_quantile
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.hedges = 0
+
+    @classmethod
+    def from_config(cls) -> "ProviderPool":
+        urls = Config.OPEN_WEATHER_API_URLS or [Config.OPEN_WEATHER_API_URL]
+        keys = Config.OPEN_WEATHER_API_KEYS or [Config.OPEN_WEATHER_API_KEY]
+        if len(urls) == len(keys):
+            pairs = list(zip(urls, keys))
+        else:
+            pairs = [(url, key) for url in urls for key in keys]
+
+        providers = [
+            WeatherProvider(f"{index}:{urlparse(url or '').netloc}", url, key)
+            for index, (url, key) in enumerate(pairs)
+        ]
+        return cls(
+            providers,
+            hedge_enabled=Config.HEDGE_ENABLED,
+            hedge_quantile=Config.HEDGE_QUANTILE,
+            min_delay=Config.HEDGE_MIN_DELAY,
+            max_delay=Config.HEDGE_MAX_DELAY,
+        )
+
+    def ranked(self) -> list[WeatherProvider]:
+        return sorted(
+            self.providers,
+            key=lambda provider: (not provider.healthy, provider.ewma or 0.0))
+
+    def hedge_delay(self, provider: WeatherProvider) -> float:
+        if len(provider.latencies) < self.MIN_SAMPLES:
+            return self.max_delay
+        delay = provider.latency_quantile(self.hedge_quantile)
+        return min(self.max_delay, max(self.min_delay, delay))
+
+    async def fetch(self, client: httpx.AsyncClient, city_id: int) -> dict[str, Any]:
+        ranked = self.ranked()
+        primary = ranked[0]
+        fallback = ranked[1] if len(ranked) > 1 else None
+
+        started = time.perf_counter()
+        attempts = [asyncio.create_task(primary.fetch(client, city_id))]
+        hedged = False
+        try:
+            hedge = self.hedge_enabled and fallback is not None
+            timeout = self.hedge_delay(primary) if hedge else None
+            done, _ = await asyncio.wait(attempts, timeout=timeout)
+
+            if not done:
+                self.hedges += 1
+                hedged = True
+                attempts.append(asyncio.create_task(fallback.fetch(client, city_id)))
+            elif attempts[0].exception() is not None and fallback is not None:
+                attempts.append(asyncio.create_task(fallback.fetch(client, city_id)))
+
+            return await self._first_success(attempts)
+        finally:
+            if hedged and not attempts[0].done():
+                primary.record_censored(time.perf_counter() - started)
+            for attempt in attempts:
+                attempt.cancel()
+
+    async def warm_up(self, client: httpx.AsyncClient, timeout: float = 2.0) -> None:
+        """Open a pooled connection to every provider before real traffic."""
+        async def connect(provider: WeatherProvider) -> None:
+            try:
+                await client.head(provider.base_url, timeout=timeout)
+            except Exception:
+                pass
+
+        await asyncio.gather(*(connect(provider) for provider in self.providers))
+
+    @staticmethod
+    async def _first_success(attempts: list[asyncio.Task]) -> dict[str, Any]:
+        pending = set(attempts)
+        error: Optional[BaseException] = None
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for attempt in done:
+                if attempt.exception() is None:
+                    return attempt.result()
+                error = attempt.exception()
+        raise error
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "hedges": self.hedges,
+            "providers": [provider.stats() for provider in self.ranked()],
+        }
@@ -1,33 +1,93 @@
-import json
+import asyncio
+import logging
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, AsyncIterator, Optional
 
 import httpx
 
 from src.config.config import Config
 from src.db.connection import SessionLocal
+from src.diagnostics.diagnostics import track
 from src.models.models import WeatherData
+from src.services.providers import ProviderPool
+from src.utils.cache import TTLCache
 from src.utils.cities import CITIES_ID
+from src.utils.fields import WEATHER_FIELDS
+from src.utils.readings import (
+    ReadingLayout,
+    extract_fields,
+    upgrade_legacy_readings,
+)
+
+logger = logging.getLogger(__name__)
+
+provider_pool = ProviderPool.from_config()
+
+reading_layout = ReadingLayout(
+    Config.WEATHER_FIELDS or [field.name for field in WEATHER_FIELDS])
+
+weather_cache = TTLCache(Config.WEATHER_CACHE_TTL)
+
+http_client: Optional[httpx.AsyncClient] = None
+
+
+async def open_http_client() -> httpx.AsyncClient:
+    global http_client
+    if http_client is None:
+        http_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(Config.UPSTREAM_TIMEOUT))
+    return http_client
+
+
+async def close_http_client() -> None:
+    global http_client
+    if http_client is not None:
+        await http_client.aclose()
+        http_client = None
+
+
+@asynccontextmanager
+async def upstream_client() -> AsyncIterator[httpx.AsyncClient]:
+    if http_client is not None:
+        yield http_client
+        return
+    async with httpx.AsyncClient(timeout=httpx.Timeout(Config.UPSTREAM_TIMEOUT)) as client:
+        yield client
 
 
 async def get_weather_info(city_id: int) -> dict[str, Any]:
-    timeout = httpx.Timeout(10.0)
-    async with httpx.AsyncClient(timeout=timeout) as client:
-        weather_response = await client.get(
-            Config.OPEN_WEATHER_API_URL,
-            params={
-                "id": city_id,
-                "appid": Config.OPEN_WEATHER_API_KEY,
-                "units": "metric",
-            }
-        )
-        weather_response.raise_for_status()
-        weather_json = weather_response.json()
-        return {
+    cached_weather = weather_cache.get(city_id)
+    if cached_weather is not None:
+        return cached_weather
+
+    async with upstream_client() as client:
+        with track("upstream"):
+            weather_json = await provider_pool.fetch(client, city_id)
+        city_weather = {
             "city_id": city_id,
-            "temperature": weather_json["main"]["temp"],
-            "humidity": weather_json["main"]["humidity"],
+            **extract_fields(weather_json, reading_layout.fields),
         }
+        weather_cache.set(city_id, city_weather)
+        return city_weather
+
+
+async def prewarm_weather_cache(cities_list: list = CITIES_ID,
+                                concurrency: int = Config.PREWARM_CONCURRENCY) -> int:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def prewarm_city(city_id: int) -> bool:
+        async with semaphore:
+            try:
+                await get_weather_info(city_id)
+                return True
+            except Exception as e:
+                logger.warning(
+                    "Could not prewarm weather for city %s: %s", city_id, e)
+                return False
+
+    results = await asyncio.gather(*(prewarm_city(city) for city in cities_list))
+    return sum(results)
 
 
 async def get_and_save_weather_info(request_id: str, cities_list: list = CITIES_ID) -> None:
@@ -36,23 +96,30 @@ async def get_and_save_weather_info(request_id: str, cities_list: list = CITIES_
         for city in cities_list:
             city_weather = await get_weather_info(city)
 
-            record = database_session.query(WeatherData).filter(
-                WeatherData.request_id == request_id
-            ).first()
+            with track("db"):
+                record = database_session.query(WeatherData).filter(
+                    WeatherData.request_id == request_id
+                ).first()
 
             if record is not None:
-                current_data = json.loads(record.data) if record.data else []
-                current_data.append(city_weather)
-                record.data = json.dumps(current_data)
+                with track("serialization"):
+                    stored_data = upgrade_legacy_readings(
+                        record.data, reading_layout)
+                    layout = ReadingLayout.from_blob(stored_data)
+                    record.data = stored_data + layout.encode(city_weather)
             else:
-                new_weather_data = WeatherData(
-                    request_id=request_id,
-                    timestamp=datetime.now(timezone.utc),
-                    data=json.dumps([city_weather])
-                )
+                with track("serialization"):
+                    new_weather_data = WeatherData(
+                        request_id=request_id,
+                        timestamp=datetime.now(timezone.utc),
+                        data=reading_layout.header +
+                        reading_layout.encode(city_weather)
+                    )
                 database_session.add(new_weather_data)
 
-            database_session.commit()
-            database_session.refresh(record if record else new_weather_data)
+            with track("db"):
+                database_session.commit()
+                database_session.refresh(
+                    record if record else new_weather_data)
     finally:
         database_session.close()
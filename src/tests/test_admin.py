@@ -0,0 +1,73 @@
+from unittest.mock import patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.diagnostics.diagnostics import LoopLagMonitor
+from src.routes.admin import router as admin_router
+
+app = FastAPI()
+app.include_router(admin_router)
+
+client = TestClient(app, headers={"X-Admin-Token": "secret"})
+
+
+@pytest.fixture(autouse=True)
+def admin_token():
+    with patch("src.routes.admin.Config.ADMIN_TOKEN", "secret"):
+        yield
+
+
+def test_profile_returns_folded_stacks():
+    response = client.get("/admin/profile", params={"seconds": 0.05})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    for line in response.text.splitlines():
+        stack, count = line.rsplit(" ", 1)
+        assert int(count) > 0
+
+
+def test_profile_rejects_long_duration():
+    response = client.get("/admin/profile", params={"seconds": 3600})
+    assert response.status_code == 422
+
+
+def test_loop_lag_without_monitor():
+    response = client.get("/admin/loop-lag")
+    assert response.status_code == 503
+
+
+def test_loop_lag_with_monitor():
+    app.state.loop_monitor = LoopLagMonitor()
+    try:
+        response = client.get("/admin/loop-lag")
+        assert response.status_code == 200
+        assert response.json()["samples"] == 0
+    finally:
+        del app.state.loop_monitor
+
+
+def test_admin_token_required():
+    anonymous_client = TestClient(app)
+    assert anonymous_client.get("/admin/loop-lag").status_code == 403
+    response = anonymous_client.get(
+        "/admin/loop-lag", headers={"X-Admin-Token": "wrong"})
+    assert response.status_code == 403
+
+
+def test_admin_disabled_without_token():
+    with patch("src.routes.admin.Config.ADMIN_TOKEN", None):
+        for path in ("/admin/loop-lag", "/admin/providers", "/admin/profile"):
+            response = client.get(path)
+            assert response.status_code == 403
+            assert response.json() == {
+                "detail": "Admin token is not configured."}
+
+
+def test_providers_stats():
+    response = client.get("/admin/providers")
+    assert response.status_code == 200
+    body = response.json()
+    assert body["hedges"] >= 0
+    assert body["providers"]
@@ -0,0 +1,28 @@
+import subprocess
+from unittest.mock import patch
+
+import pytest
+
+from src.diagnostics.benchmark import run_once, summarize
+
+
+def test_summarize():
+    runs = [
+        {"import_ms": 100.0, "ready_ms": 150.0},
+        {"import_ms": 120.0, "ready_ms": 130.0},
+        {"import_ms": 110.0, "ready_ms": 170.0},
+    ]
+    assert summarize(runs) == {
+        "import_ms": {"min": 100.0, "median": 110.0, "max": 120.0},
+        "ready_ms": {"min": 130.0, "median": 150.0, "max": 170.0},
+    }
+
+
+def test_run_once_reports_failed_run():
+    error = subprocess.CalledProcessError(
+        1, "probe", stderr="Not ready after 1.0 s: {'database': False}\n")
+    with patch("src.diagnostics.benchmark.subprocess.run", side_effect=error) as mock_run:
+        with pytest.raises(RuntimeError, match="Not ready after 1.0 s"):
+            run_once(timeout=1.0)
+
+    assert mock_run.call_args.kwargs["timeout"] == 31.0
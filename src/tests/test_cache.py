@@ -0,0 +1,39 @@
+from unittest.mock import patch
+
+from src.utils.cache import TTLCache
+
+
+def test_get_missing_key():
+    assert TTLCache(60).get("missing") is None
+
+
+def test_set_and_get():
+    cache = TTLCache(60)
+    cache.set(1, {"temperature": 20.0})
+    assert cache.get(1) == {"temperature": 20.0}
+    assert len(cache) == 1
+
+
+def test_entries_expire():
+    cache = TTLCache(60)
+    with patch("src.utils.cache.time.monotonic", return_value=1000.0):
+        cache.set(1, "value")
+    with patch("src.utils.cache.time.monotonic", return_value=1059.0):
+        assert cache.get(1) == "value"
+    with patch("src.utils.cache.time.monotonic", return_value=1060.0):
+        assert cache.get(1) is None
+    assert len(cache) == 0
+
+
+def test_disabled_cache_stores_nothing():
+    cache = TTLCache(0)
+    cache.set(1, "value")
+    assert not cache.enabled
+    assert cache.get(1) is None
+
+
+def test_clear():
+    cache = TTLCache(60)
+    cache.set(1, "value")
+    cache.clear()
+    assert len(cache) == 0
@@ -1,9 +1,10 @@
 import os
+from pathlib import Path
 
 import pytest
 from dotenv import load_dotenv
 
-from src.config.config import Config
+from src.config.config import ENV_FILE, Config
 
 load_dotenv()
 
@@ -17,3 +18,8 @@ def setup_env():
 
 def test_open_weather_api_key():
     assert Config.OPEN_WEATHER_API_KEY == Config.OPEN_WEATHER_API_KEY, "OPEN_WEATHER_API_KEY should be 'test_api_key'"
+
+
+def test_env_file_defaults_to_repository_root():
+    repository_root = Path(__file__).resolve().parents[2]
+    assert ENV_FILE == repository_root / ".env"
@@ -2,7 +2,15 @@ import pytest
 from sqlalchemy import text
 from sqlalchemy.exc import OperationalError
 
-from src.db.connection import SessionLocal, engine, init_db
+from src.config.config import Config
+from src.db.connection import (
+    SessionLocal,
+    check_schema,
+    engine,
+    init_db,
+    warm_up_pool,
+)
+from src.models import models  # noqa: F401
 
 
 @pytest.fixture(scope="module")
@@ -56,3 +64,16 @@ def test_session_creation_failure():
             SessionLocal()
     finally:
         globals()["SessionLocal"] = original_session_local
+
+
+def test_check_schema(setup_database):
+    assert check_schema() == []
+
+
+def test_warm_up_pool(setup_database):
+    warm_up_pool(connections=2)
+    assert engine.pool.checkedin() >= 2
+
+
+def test_database_url_comes_from_config():
+    assert str(engine.url) == Config.DATABASE_URL
@@ -0,0 +1,96 @@
+import asyncio
+import logging
+import threading
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.diagnostics.diagnostics import (
+    LoopLagMonitor,
+    format_server_timing,
+    render_folded,
+    sample_stacks,
+    server_timing_middleware,
+    track,
+)
+
+
+def test_track_is_noop_outside_request():
+    with track("db"):
+        pass
+
+
+def test_format_server_timing():
+    header = format_server_timing({"db": 0.0015, "total": 0.01})
+    assert header == "db;dur=1.50, total;dur=10.00"
+
+
+def test_server_timing_header():
+    app = FastAPI()
+    app.middleware("http")(server_timing_middleware)
+
+    @app.get("/timed")
+    async def timed():
+        with track("db"):
+            time.sleep(0.01)
+        with track("db"):
+            pass
+        return {}
+
+    response = TestClient(app).get("/timed")
+    assert response.status_code == 200
+
+    phases = dict(
+        entry.split(";dur=") for entry in response.headers["Server-Timing"].split(", "))
+    assert set(phases) == {"db", "total"}
+    assert float(phases["db"]) >= 10.0
+    assert float(phases["total"]) >= float(phases["db"])
+
+
+def test_sample_stacks_collapsed_format():
+    stop = threading.Event()
+
+    def busy_worker():
+        stop.wait()
+
+    worker = threading.Thread(target=busy_worker, name="busy-worker")
+    worker.start()
+    try:
+        samples = sample_stacks(0.05, interval=0.005)
+    finally:
+        stop.set()
+        worker.join()
+
+    worker_stacks = [stack for stack in samples if stack.startswith("busy-worker;")]
+    assert worker_stacks
+    assert any("busy_worker (test_diagnostics.py:" in stack for stack in worker_stacks)
+
+    folded = render_folded(samples)
+    for line in folded.splitlines():
+        stack, count = line.rsplit(" ", 1)
+        assert stack and int(count) > 0
+
+
+@pytest.mark.asyncio
+async def test_loop_lag_monitor_reports_blocking_callback(caplog):
+    monitor = LoopLagMonitor(interval=0.02, threshold=0.05)
+    monitor.start()
+    try:
+        await asyncio.sleep(0.05)
+        with caplog.at_level(logging.WARNING, logger="src.diagnostics.diagnostics"):
+            time.sleep(0.2)
+            await asyncio.sleep(0.05)
+    finally:
+        await monitor.stop()
+
+    stats = monitor.stats()
+    assert stats["samples"] > 0
+    assert stats["slow_callbacks"] >= 1
+    assert stats["max_ms"] >= 100
+    assert "test_loop_lag_monitor_reports_blocking_callback" in caplog.text
+
+
+def test_loop_lag_monitor_stats_empty():
+    assert LoopLagMonitor().stats() == {"samples": 0, "slow_callbacks": 0}
@@ -0,0 +1,47 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.routes.health import router as health_router
+
+app = FastAPI()
+app.include_router(health_router)
+
+client = TestClient(app)
+
+
+def test_healthz():
+    response = client.get("/healthz")
+    assert response.status_code == 200
+    assert response.json() == {"status": "ok"}
+
+
+def test_readyz_before_startup():
+    response = client.get("/readyz")
+    assert response.status_code == 503
+    assert response.json()["status"] == "starting"
+
+
+def test_readyz_partially_ready():
+    app.state.readiness = {"database": True, "upstream": False}
+    try:
+        response = client.get("/readyz")
+        assert response.status_code == 503
+        assert response.json()["checks"] == {"database": True, "upstream": False}
+    finally:
+        del app.state.readiness
+
+
+def test_readyz_ready():
+    app.state.readiness = {"database": True, "upstream": True}
+    app.state.startup = {"ready_ms": 12.5}
+    try:
+        response = client.get("/readyz")
+        assert response.status_code == 200
+        assert response.json() == {
+            "status": "ready",
+            "checks": {"database": True, "upstream": True},
+            "startup": {"ready_ms": 12.5},
+        }
+    finally:
+        del app.state.readiness
+        del app.state.startup
@@ -1,3 +1,7 @@
+import asyncio
+import logging
+from unittest.mock import AsyncMock, patch
+
 from fastapi.testclient import TestClient
 
 from src.main import app
@@ -10,3 +14,74 @@ def test_root_endpoint():
     assert response.status_code == 200
     assert response.json() == {
         "message": "Welcome to the DevGrid Weather Challenge"}
+
+
+def test_lifespan_reports_ready():
+    with patch("src.main.Config.WARM_UP_UPSTREAM", False):
+        with TestClient(app) as lifespan_client:
+            response = lifespan_client.get("/readyz")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["checks"] == {"database": True, "upstream": True, "cache": True}
+    assert body["startup"]["ready_ms"] > 0
+
+
+def test_lifespan_not_ready_without_schema():
+    with patch("src.main.Config.WARM_UP_UPSTREAM", False), \
+            patch("src.main.init_db") as mock_init_db, \
+            patch("src.main.check_schema", return_value=["weather_data"]):
+        with TestClient(app) as lifespan_client:
+            assert lifespan_client.get("/healthz").status_code == 200
+            response = lifespan_client.get("/readyz")
+
+    mock_init_db.assert_called_once()
+    assert response.status_code == 503
+    assert response.json()["checks"]["database"] is False
+
+
+def test_lifespan_prewarms_weather_cache():
+    with patch("src.main.Config.WARM_UP_UPSTREAM", False), \
+            patch("src.main.Config.PREWARM_WEATHER_CACHE", True), \
+            patch("src.main.weather_cache.ttl", 60), \
+            patch("src.main.prewarm_weather_cache", new_callable=AsyncMock) as mock_prewarm:
+        mock_prewarm.return_value = 167
+        with TestClient(app) as lifespan_client:
+            response = lifespan_client.get("/readyz")
+
+    mock_prewarm.assert_awaited_once()
+    assert response.json()["startup"]["prewarmed_cities"] == 167
+
+
+def test_lifespan_logs_failed_warm_up(caplog):
+    with patch("src.main.Config.WARM_UP_UPSTREAM", True), \
+            patch("src.main.provider_pool.warm_up", new_callable=AsyncMock) as mock_warm_up, \
+            caplog.at_level(logging.ERROR, logger="src.main"):
+        mock_warm_up.side_effect = Exception("Upstream unreachable")
+        with TestClient(app) as lifespan_client:
+            response = lifespan_client.get("/readyz")
+
+    assert response.status_code == 503
+    assert response.json()["startup"]["error"] == "Warm-up failed: Upstream unreachable"
+    assert "Application warm-up failed." in caplog.text
+
+
+def test_shutdown_waits_for_cancelled_warm_up():
+    finished = []
+
+    async def slow_prewarm():
+        try:
+            await asyncio.sleep(10)
+        finally:
+            finished.append(True)
+
+    with patch("src.main.Config.WARM_UP_UPSTREAM", False), \
+            patch("src.main.Config.PREWARM_WEATHER_CACHE", True), \
+            patch("src.main.weather_cache.ttl", 60), \
+            patch("src.main.prewarm_weather_cache", side_effect=slow_prewarm), \
+            patch("src.main.close_http_client", new_callable=AsyncMock) as mock_close:
+        mock_close.side_effect = lambda: finished.append("closed")
+        with TestClient(app):
+            pass
+
+    assert finished == [True, "closed"]
@@ -0,0 +1,39 @@
+import json
+
+import pytest
+from sqlalchemy import text
+
+from src.db.connection import SessionLocal, init_db
+from src.db.migrate import migrate_legacy_readings
+from src.models.models import WeatherData
+from src.utils.readings import ReadingLayout
+
+LEGACY_READINGS = [{"city_id": 3439525, "temperature": 20.5, "humidity": 70}]
+
+
+@pytest.fixture
+def legacy_record():
+    init_db()
+    with SessionLocal() as database_session:
+        database_session.execute(
+            text("INSERT INTO weather_data (request_id, data) VALUES (:request_id, :data)"),
+            {"request_id": "legacy_request_id",
+             "data": json.dumps(json.dumps(LEGACY_READINGS))})
+        database_session.commit()
+    yield "legacy_request_id"
+    with SessionLocal() as database_session:
+        database_session.query(WeatherData).filter(
+            WeatherData.request_id == "legacy_request_id").delete()
+        database_session.commit()
+
+
+def test_migrate_legacy_readings(legacy_record):
+    assert migrate_legacy_readings() >= 1
+
+    with SessionLocal() as database_session:
+        record = database_session.query(WeatherData).filter(
+            WeatherData.request_id == legacy_record).first()
+        layout = ReadingLayout.from_blob(record.data)
+        assert layout.decode(record.data, ["temperature", "humidity"]) == LEGACY_READINGS
+
+    assert migrate_legacy_readings() == 0
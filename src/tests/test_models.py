@@ -1,5 +1,5 @@
 import pytest
-from sqlalchemy import JSON, DateTime, String, create_engine, inspect
+from sqlalchemy import BLOB, DateTime, String, create_engine, inspect
 from sqlalchemy.orm import sessionmaker
 
 from src.db.base import Base
@@ -35,7 +35,7 @@ def test_column_types(setup_database):
     assert isinstance(
         column_types["timestamp"], DateTime), "Column 'timestamp' should be of type DateTime."
     assert isinstance(column_types["data"],
-                      JSON), "Column 'data' should be of type JSON."
+                      BLOB), "Column 'data' should be of type BLOB."
 
 
 def test_column_existence(setup_database):
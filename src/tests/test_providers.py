@@ -0,0 +1,146 @@
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from src.services.providers import ProviderPool, WeatherProvider
+
+
+class FakeClient:
+    def __init__(self, delays: dict[str, float], failing: tuple = ()):
+        self.delays = delays
+        self.failing = failing
+        self.calls: list[str] = []
+
+    async def get(self, url, params=None):
+        self.calls.append(url)
+        await asyncio.sleep(self.delays.get(url, 0))
+        response = MagicMock()
+        if url in self.failing:
+            response.raise_for_status.side_effect = httpx.HTTPStatusError(
+                "Error", request=MagicMock(), response=MagicMock(status_code=500))
+        response.json.return_value = {"url": url}
+        return response
+
+
+def make_pool(*urls, **kwargs):
+    return ProviderPool([WeatherProvider(url, url, "key") for url in urls], **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_fetch_without_hedge_when_primary_is_fast():
+    pool = make_pool("fast", "slow", max_delay=0.5)
+    client = FakeClient({"fast": 0, "slow": 0})
+
+    assert await pool.fetch(client, 1) == {"url": "fast"}
+    assert client.calls == ["fast"]
+    assert pool.hedges == 0
+
+
+@pytest.mark.asyncio
+async def test_fetch_hedges_slow_primary():
+    pool = make_pool("slow", "fast", max_delay=0.02)
+    client = FakeClient({"slow": 1.0, "fast": 0})
+
+    assert await pool.fetch(client, 1) == {"url": "fast"}
+    assert client.calls == ["slow", "fast"]
+    assert pool.hedges == 1
+
+    slow = pool.providers[0]
+    assert slow.requests == 1
+    assert slow.failures == 0
+    assert slow.latencies[-1] >= 0.02
+
+
+@pytest.mark.asyncio
+async def test_single_provider_is_not_hedged():
+    pool = make_pool("only", max_delay=0.01)
+    client = FakeClient({"only": 0.05})
+
+    assert await pool.fetch(client, 1) == {"url": "only"}
+    assert client.calls == ["only"]
+    assert pool.hedges == 0
+    assert pool.providers[0].latencies[-1] >= 0.05
+
+
+@pytest.mark.asyncio
+async def test_degraded_primary_is_demoted():
+    pool = make_pool("a", "b", min_delay=0.01, max_delay=0.05)
+    a, b = pool.providers
+    for _ in range(ProviderPool.MIN_SAMPLES):
+        a.record_success(0.001)
+    b.record_success(0.02)
+    client = FakeClient({"a": 1.0, "b": 0.02})
+
+    assert pool.ranked()[0] is a
+    for _ in range(10):
+        await pool.fetch(client, 1)
+        if pool.ranked()[0] is b:
+            break
+
+    assert pool.ranked()[0] is b
+    assert pool.hedges < 10
+
+
+@pytest.mark.asyncio
+async def test_fetch_fails_over_on_error():
+    pool = make_pool("broken", "backup")
+    client = FakeClient({}, failing=("broken",))
+
+    assert await pool.fetch(client, 1) == {"url": "backup"}
+    assert pool.providers[0].failures == 1
+    assert pool.hedges == 0
+
+
+@pytest.mark.asyncio
+async def test_fetch_raises_when_all_providers_fail():
+    pool = make_pool("a", "b")
+    client = FakeClient({}, failing=("a", "b"))
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await pool.fetch(client, 1)
+
+
+def test_ranked_prefers_fastest_healthy_provider():
+    pool = make_pool("slow", "fast", "broken")
+    slow, fast, broken = pool.providers
+    slow.record_success(0.5)
+    fast.record_success(0.1)
+    broken.record_success(0.01)
+    for _ in range(WeatherProvider.FAILURE_THRESHOLD):
+        broken.record_failure()
+
+    assert not broken.healthy
+    assert pool.ranked() == [fast, slow, broken]
+
+
+def test_hedge_delay_tracks_latency_quantile():
+    pool = make_pool("a", min_delay=0.05, max_delay=2.0)
+    provider = pool.providers[0]
+    assert pool.hedge_delay(provider) == 2.0
+
+    for latency in [0.1] * 95 + [1.0] * 5:
+        provider.record_success(latency)
+    assert pool.hedge_delay(provider) == 1.0
+
+    provider.latencies.clear()
+    for _ in range(ProviderPool.MIN_SAMPLES):
+        provider.record_success(0.001)
+    assert pool.hedge_delay(provider) == 0.05
+
+
+def test_from_config_pairs_urls_and_keys():
+    with patch("src.services.providers.Config") as config:
+        config.OPEN_WEATHER_API_URLS = ["http://a.test/w", "http://b.test/w"]
+        config.OPEN_WEATHER_API_KEYS = ["k1"]
+        pool = ProviderPool.from_config()
+
+    assert [(p.base_url, p.api_key) for p in pool.providers] == [
+        ("http://a.test/w", "k1"), ("http://b.test/w", "k1")]
+    assert [p.name for p in pool.providers] == ["0:a.test", "1:b.test"]
+
+
+def test_pool_requires_providers():
+    with pytest.raises(ValueError):
+        ProviderPool([])
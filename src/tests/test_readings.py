@@ -0,0 +1,109 @@
+import json
+import logging
+
+import pytest
+
+from src.utils.fields import WEATHER_FIELDS
+from src.utils.readings import (
+    ReadingLayout,
+    extract_fields,
+    is_legacy_readings,
+    parse_fields,
+    upgrade_legacy_readings,
+)
+
+UPSTREAM_RESPONSE = {
+    "weather": [{"id": 803, "main": "Clouds"}],
+    "main": {"temp": 21.37, "feels_like": 21.5, "temp_min": 20.1, "temp_max": 22.9,
+             "pressure": 1013, "humidity": 78},
+    "visibility": 10000,
+    "wind": {"speed": 4.12, "deg": 150},
+    "clouds": {"all": 75},
+}
+
+
+def test_field_names_unique():
+    names = [field.name for field in WEATHER_FIELDS]
+    assert len(names) == len(set(names))
+
+
+def test_parse_fields():
+    assert parse_fields(["temperature", " wind_speed", ""]) == [
+        "temperature", "wind_speed"]
+    with pytest.raises(ValueError, match="Unknown field"):
+        parse_fields(["temperature", "snow"])
+
+
+def test_extract_fields():
+    values = extract_fields(UPSTREAM_RESPONSE, WEATHER_FIELDS)
+    assert values["temperature"] == 21.37
+    assert values["condition_id"] == 803
+    assert values["wind_speed"] == 4.12
+    assert values["rain_1h"] is None
+
+
+def test_round_trip_all_fields():
+    layout = ReadingLayout(field.name for field in WEATHER_FIELDS)
+    reading = {"city_id": 3439525, **extract_fields(UPSTREAM_RESPONSE, WEATHER_FIELDS)}
+    blob = layout.header + layout.encode(reading) + layout.encode(reading)
+
+    assert layout.count(blob) == 2
+    assert ReadingLayout.from_blob(blob).decode(blob) == [reading, reading]
+
+
+def test_decode_only_requested_fields():
+    layout = ReadingLayout(["temperature", "humidity", "pressure"])
+    blob = layout.header + \
+        layout.encode({"city_id": 1, "temperature": -3.5, "humidity": 40})
+
+    assert layout.decode(blob, ["pressure", "wind_speed"]) == [
+        {"city_id": 1, "pressure": None, "wind_speed": None}]
+    assert layout.decode(blob, []) == [{"city_id": 1}]
+
+
+def test_decode_keeps_requested_order():
+    layout = ReadingLayout(["temperature", "humidity", "pressure"])
+    blob = layout.header + layout.encode(
+        {"city_id": 1, "temperature": 10.0, "humidity": 40, "pressure": 1000})
+
+    reading = layout.decode(blob, ["pressure", "wind_speed", "temperature"])[0]
+    assert list(reading) == ["city_id", "pressure", "wind_speed", "temperature"]
+    assert list(layout.decode(blob)[0]) == [
+        "city_id", "temperature", "humidity", "pressure"]
+
+
+def test_out_of_range_value_is_stored_as_missing(caplog):
+    layout = ReadingLayout(["humidity"])
+    with caplog.at_level(logging.WARNING, logger="src.utils.readings"):
+        blob = layout.header + layout.encode({"city_id": 1, "humidity": 300})
+
+    assert layout.decode(blob) == [{"city_id": 1, "humidity": None}]
+    assert "humidity=300 of city 1" in caplog.text
+
+
+def test_binary_is_smaller_than_json():
+    layout = ReadingLayout(field.name for field in WEATHER_FIELDS)
+    readings = [{"city_id": 3439525 + index,
+                 **extract_fields(UPSTREAM_RESPONSE, WEATHER_FIELDS)} for index in range(167)]
+    blob = layout.header + b"".join(layout.encode(reading) for reading in readings)
+    assert len(blob) * 3 < len(json.dumps(readings))
+
+
+def test_unsupported_version():
+    with pytest.raises(ValueError, match="version"):
+        ReadingLayout.from_blob(b"\x09\x00")
+
+
+def test_upgrade_legacy_readings():
+    layout = ReadingLayout(["temperature", "humidity"])
+    legacy_readings = [{"city_id": 1, "temperature": 20.5, "humidity": 70}]
+    expected = layout.header + layout.encode(legacy_readings[0])
+
+    for stored in (json.dumps(json.dumps(legacy_readings)),
+                   json.dumps(legacy_readings),
+                   json.dumps(legacy_readings).encode()):
+        assert is_legacy_readings(stored)
+        assert upgrade_legacy_readings(stored, layout) == expected
+
+    assert not is_legacy_readings(expected)
+    assert upgrade_legacy_readings(expected, layout) is expected
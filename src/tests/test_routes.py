@@ -1,13 +1,18 @@
 
 import json
+import time
 from unittest.mock import AsyncMock, patch
 
 import pytest
+from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
+from src.diagnostics.diagnostics import server_timing_middleware
 from src.main import app
 from src.models.models import WeatherData
-from src.schemas.schemas import UserWeatherRequest
+from src.routes.routes import router
+from src.schemas.schemas import UserWeatherRequest, WeatherProgressResponse
+from src.utils.readings import ReadingLayout
 
 client = TestClient(app)
 
@@ -68,11 +73,12 @@ async def test_start_weather_data_collection_exception():
 @pytest.mark.asyncio
 async def test_get_weather_data_success():
     request_id = "valid_request_id"
+    layout = ReadingLayout(["temperature", "humidity", "wind_speed"])
     mock_weather_data = WeatherData(request_id=request_id, timestamp="2024-01-01T00:00:00Z",
-                                    data=json.dumps([{"city_id": 3439525, "temperature": 20.0, "humidity": 70}]))
+                                    data=layout.header + layout.encode({"city_id": 3439525, "temperature": 20.0, "humidity": 70, "wind_speed": 3.6}))
 
     with patch("src.routes.routes.SessionLocal") as mock_session:
-        mock_db = mock_session.return_value
+        mock_db = mock_session.return_value.__enter__.return_value
         mock_db.query.return_value.filter.return_value.first.return_value = mock_weather_data
 
         response = client.get(f"/weather/{request_id}")
@@ -80,10 +86,16 @@ async def test_get_weather_data_success():
         assert response.json() == {
             "request_id": request_id,
             "timestamp": "2024-01-01T00:00:00Z",
-            "data": json.dumps([{"city_id": 3439525, "temperature": 20.0, "humidity": 70}]),
-            "upload_progress": "100% uploaded..."
+            "data": [{"city_id": 3439525, "temperature": 20.0, "humidity": 70}],
+            "upload_progress": "0% uploaded..."
         }
 
+        response = client.get(
+            f"/weather/{request_id}", params={"fields": "wind_speed,pressure"})
+        assert response.status_code == 200
+        assert response.json()["data"] == [
+            {"city_id": 3439525, "wind_speed": 3.6, "pressure": None}]
+
 
 @pytest.mark.asyncio
 async def test_get_weather_data_request_id_empty():
@@ -119,3 +131,55 @@ async def test_get_weather_data_exception():
         assert response.status_code == 500
         assert response.json() == {
             "detail": "An unexpected error occurred. Please try again later."}
+
+
+@pytest.mark.asyncio
+async def test_get_weather_data_unknown_field():
+    response = client.get("/weather/valid_request_id", params={"fields": "temperature,snow"})
+    assert response.status_code == 422
+    assert response.json() == {"detail": "Unknown field(s): snow."}
+
+
+@pytest.mark.asyncio
+async def test_get_weather_data_legacy_json_record():
+    request_id = "legacy_request_id"
+    legacy_readings = [{"city_id": 3439525, "temperature": 20.0, "humidity": 70}]
+    mock_weather_data = WeatherData(request_id=request_id, timestamp="2024-01-01T00:00:00Z",
+                                    data=json.dumps(json.dumps(legacy_readings)))
+
+    with patch("src.routes.routes.SessionLocal") as mock_session:
+        mock_db = mock_session.return_value.__enter__.return_value
+        mock_db.query.return_value.filter.return_value.first.return_value = mock_weather_data
+
+        response = client.get(f"/weather/{request_id}")
+        assert response.status_code == 200
+        assert response.json()["data"] == legacy_readings
+
+
+@pytest.mark.asyncio
+async def test_get_weather_data_server_timing_includes_rendering():
+    timed_app = FastAPI()
+    timed_app.middleware("http")(server_timing_middleware)
+    timed_app.include_router(router)
+
+    layout = ReadingLayout(["temperature", "humidity"])
+    mock_weather_data = WeatherData(request_id="valid_request_id", timestamp="2024-01-01T00:00:00Z",
+                                    data=layout.header + layout.encode({"city_id": 3439525, "temperature": 20.0, "humidity": 70}))
+    render_json = WeatherProgressResponse.model_dump_json
+
+    def slow_render_json(self, **kwargs):
+        time.sleep(0.02)
+        return render_json(self, **kwargs)
+
+    with patch("src.routes.routes.SessionLocal") as mock_session, \
+            patch.object(WeatherProgressResponse, "model_dump_json", slow_render_json):
+        mock_db = mock_session.return_value.__enter__.return_value
+        mock_db.query.return_value.filter.return_value.first.return_value = mock_weather_data
+
+        response = TestClient(timed_app).get("/weather/valid_request_id")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    phases = dict(
+        entry.split(";dur=") for entry in response.headers["Server-Timing"].split(", "))
+    assert float(phases["serialization"]) >= 20.0
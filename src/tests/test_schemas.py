@@ -42,12 +42,13 @@ def test_weather_progress_response():
     response = WeatherProgressResponse(
         request_id="test_id",
         timestamp=datetime(2024, 8, 6, 12, 0, 0),
-        data='{"city_id": 3439525, "temperature": 25, "humidity": 80"}',
+        data=[{"city_id": 3439525, "temperature": 25, "humidity": 80}],
         upload_progress="50% uploaded..."
     )
     assert response.request_id == "test_id"
     assert response.timestamp == datetime(2024, 8, 6, 12, 0, 0)
-    assert response.data == '{"city_id": 3439525, "temperature": 25, "humidity": 80"}'
+    assert response.data == [
+        {"city_id": 3439525, "temperature": 25, "humidity": 80}]
     assert response.upload_progress == "50% uploaded..."
 
 
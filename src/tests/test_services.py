@@ -1,4 +1,5 @@
 import json
+import logging
 from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -6,30 +7,38 @@ import httpx
 import pytest
 
 from src.models.models import WeatherData
-from src.services.services import get_and_save_weather_info, get_weather_info
+from src.services.services import (
+    get_and_save_weather_info,
+    get_weather_info,
+    prewarm_weather_cache,
+    reading_layout,
+)
 
 
 @pytest.mark.asyncio
 async def test_get_weather_info_success():
     city_id = 123456
     expected_response = {
+        "weather": [{"id": 500}],
         "main": {
             "temp": 25.0,
             "humidity": 60
-        }
+        },
+        "wind": {"speed": 3.6}
     }
 
     with patch("httpx.AsyncClient.get", new_callable=AsyncMock) as mock_get:
-        mock_get.return_value.json = AsyncMock(return_value=expected_response)
-        mock_get.return_value.status_code = 200
+        mock_get.return_value = MagicMock(status_code=200)
+        mock_get.return_value.json.return_value = expected_response
 
         result = await get_weather_info(city_id)
 
-        assert result == {
-            "city_id": city_id,
-            "temperature": 25.0,
-            "humidity": 60
-        }
+        assert result["city_id"] == city_id
+        assert result["temperature"] == 25.0
+        assert result["humidity"] == 60
+        assert result["wind_speed"] == 3.6
+        assert result["condition_id"] == 500
+        assert result["pressure"] is None
 
 
 @pytest.mark.asyncio
@@ -37,6 +46,7 @@ async def test_get_weather_info_http_error():
     city_id = 123456
 
     with patch("httpx.AsyncClient.get", new_callable=AsyncMock) as mock_get:
+        mock_get.return_value = MagicMock()
         mock_get.return_value.raise_for_status.side_effect = httpx.HTTPStatusError(
             "Error", request=MagicMock(), response=MagicMock(status_code=404)
         )
@@ -69,7 +79,8 @@ async def test_get_and_save_weather_info_success():
             args, _ = mock_db.add.call_args
             added_data = args[0]
             assert added_data.request_id == request_id
-            assert added_data.data == json.dumps([expected_weather_data])
+            assert reading_layout.decode(added_data.data, ["temperature", "humidity"]) == [
+                expected_weather_data]
 
             mock_db.commit.assert_called_once()
 
@@ -91,7 +102,7 @@ async def test_get_and_save_weather_info_update_existing_data():
         mock_query.first.return_value = WeatherData(
             request_id=request_id,
             timestamp=datetime.now(timezone.utc),
-            data=json.dumps(existing_data)
+            data=reading_layout.header + reading_layout.encode(existing_data[0])
         )
 
         with patch("src.services.services.get_weather_info", new_callable=AsyncMock) as mock_get_weather:
@@ -99,9 +110,10 @@ async def test_get_and_save_weather_info_update_existing_data():
 
             await get_and_save_weather_info(request_id, cities_list=[city_id])
 
-            assert len(mock_query.first().data) == 2
-            updated_data = json.loads(mock_query.first().data)
-            assert updated_data == existing_data + [expected_weather_data]
+            updated_data = mock_query.first().data
+            assert reading_layout.count(updated_data) == 2
+            assert reading_layout.decode(updated_data, ["temperature", "humidity"]) == \
+                existing_data + [expected_weather_data]
 
             mock_db.commit.assert_called_once()
 
@@ -140,3 +152,53 @@ async def test_get_and_save_weather_info_handles_exceptions():
                 await get_and_save_weather_info(request_id, cities_list=[city_id])
 
             mock_db.commit.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_weather_info_uses_cache():
+    cached_weather = {"city_id": 123456, "temperature": 25.0, "humidity": 60}
+
+    with patch("src.services.services.weather_cache") as mock_cache, \
+            patch("src.services.services.provider_pool") as mock_pool:
+        mock_cache.get.return_value = cached_weather
+
+        assert await get_weather_info(123456) == cached_weather
+        mock_pool.fetch.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_prewarm_weather_cache_counts_successes(caplog):
+    async def fake_get_weather_info(city_id):
+        if city_id == 2:
+            raise Exception("Weather data error")
+        return {"city_id": city_id}
+
+    with patch("src.services.services.get_weather_info", side_effect=fake_get_weather_info):
+        with caplog.at_level(logging.WARNING, logger="src.services.services"):
+            assert await prewarm_weather_cache([1, 2, 3], concurrency=2) == 2
+
+    assert "Could not prewarm weather for city 2: Weather data error" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_get_and_save_weather_info_appends_to_legacy_json_record():
+    request_id = "test_request_id"
+    existing_data = [{"city_id": 654321, "temperature": 22.0, "humidity": 55}]
+    expected_weather_data = {"city_id": 123456, "temperature": 25.0, "humidity": 60}
+
+    with patch("src.services.services.SessionLocal") as mock_session:
+        mock_query = mock_session.return_value.query.return_value.filter.return_value
+        mock_query.first.return_value = WeatherData(
+            request_id=request_id,
+            timestamp=datetime.now(timezone.utc),
+            data=json.dumps(json.dumps(existing_data))
+        )
+
+        with patch("src.services.services.get_weather_info", new_callable=AsyncMock) as mock_get_weather:
+            mock_get_weather.return_value = expected_weather_data
+
+            await get_and_save_weather_info(request_id, cities_list=[123456])
+
+            updated_data = mock_query.first().data
+            assert reading_layout.decode(updated_data, ["temperature", "humidity"]) == \
+                existing_data + [expected_weather_data]
@@ -0,0 +1,30 @@
+from typing import NamedTuple
+
+
+class WeatherField(NamedTuple):
+    name: str
+    path: str
+    fmt: str
+    scale: int = 1
+
+
+# Maps upstream JSON paths to fixed-width struct types. Stored readings refer
+# to fields by their position in this list, so only ever append to it.
+WEATHER_FIELDS = [
+    WeatherField("temperature", "main.temp", "h", 100),
+    WeatherField("humidity", "main.humidity", "B"),
+    WeatherField("feels_like", "main.feels_like", "h", 100),
+    WeatherField("temp_min", "main.temp_min", "h", 100),
+    WeatherField("temp_max", "main.temp_max", "h", 100),
+    WeatherField("pressure", "main.pressure", "H"),
+    WeatherField("wind_speed", "wind.speed", "H", 100),
+    WeatherField("wind_deg", "wind.deg", "H"),
+    WeatherField("clouds", "clouds.all", "B"),
+    WeatherField("visibility", "visibility", "H"),
+    WeatherField("rain_1h", "rain.1h", "H", 100),
+    WeatherField("condition_id", "weather.0.id", "H"),
+]
+
+FIELDS_BY_NAME = {field.name: field for field in WEATHER_FIELDS}
+
+DEFAULT_FIELDS = ["temperature", "humidity"]
@@ -0,0 +1,133 @@
+import json
+import logging
+import struct
+from typing import Any, Iterable, Optional, Union
+
+from src.utils.fields import FIELDS_BY_NAME, WEATHER_FIELDS, WeatherField
+
+logger = logging.getLogger(__name__)
+
+FORMAT_VERSION = 1
+
+_HEADER = struct.Struct("<BB")
+_CITY_ID = struct.Struct("<I")
+
+
+def parse_fields(names: Iterable[str]) -> list[str]:
+    fields = [name.strip() for name in names if name.strip()]
+    unknown = [name for name in fields if name not in FIELDS_BY_NAME]
+    if unknown:
+        raise ValueError(f"Unknown field(s): {', '.join(unknown)}.")
+    return fields
+
+
+def extract_fields(weather_json: dict[str, Any], fields: Iterable[WeatherField]) -> dict[str, Any]:
+    values = {}
+    for field in fields:
+        value: Any = weather_json
+        for key in field.path.split("."):
+            if isinstance(value, list) and key.isdigit() and int(key) < len(value):
+                value = value[int(key)]
+            elif isinstance(value, dict):
+                value = value.get(key)
+            else:
+                value = None
+                break
+        values[field.name] = value
+    return values
+
+
+class ReadingLayout:
+    """Fixed-width binary layout of the readings stored for one request.
+
+    A blob is a header naming the stored fields followed by one record per
+    city: the city ID, a presence bitmask and each field packed as its struct
+    type. Every record has the same size, so a blob can be counted without
+    decoding it and a single field can be read straight from its offset.
+    """
+
+    def __init__(self, field_names: Iterable[str]):
+        self.fields = [FIELDS_BY_NAME[name] for name in parse_fields(field_names)]
+        self.mask_size = (len(self.fields) + 7) // 8
+        self.header = _HEADER.pack(FORMAT_VERSION, len(self.fields)) + bytes(
+            WEATHER_FIELDS.index(field) for field in self.fields)
+
+        self._field_structs = []
+        offset = _CITY_ID.size + self.mask_size
+        for field in self.fields:
+            field_struct = struct.Struct("<" + field.fmt)
+            self._field_structs.append((field, offset, field_struct))
+            offset += field_struct.size
+        self.record_size = offset
+
+    @classmethod
+    def from_blob(cls, blob: bytes) -> "ReadingLayout":
+        version, count = _HEADER.unpack_from(blob)
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported readings format version {version}.")
+        indexes = blob[_HEADER.size:_HEADER.size + count]
+        return cls(WEATHER_FIELDS[index].name for index in indexes)
+
+    def encode(self, reading: dict[str, Any]) -> bytes:
+        record = bytearray(self.record_size)
+        _CITY_ID.pack_into(record, 0, reading["city_id"])
+        mask = 0
+        for position, (field, offset, field_struct) in enumerate(self._field_structs):
+            value = reading.get(field.name)
+            if value is None:
+                continue
+            try:
+                field_struct.pack_into(record, offset, round(value * field.scale))
+            except (struct.error, TypeError) as e:
+                logger.warning("Storing %s=%r of city %s as missing: %s",
+                               field.name, value, reading["city_id"], e)
+                continue
+            mask |= 1 << position
+        record[_CITY_ID.size:_CITY_ID.size + self.mask_size] = mask.to_bytes(
+            self.mask_size, "little")
+        return bytes(record)
+
+    def count(self, blob: bytes) -> int:
+        return (len(blob) - len(self.header)) // self.record_size
+
+    def decode(self, blob: bytes, field_names: Optional[Iterable[str]] = None) -> list[dict[str, Any]]:
+        """Decode ``field_names`` (all stored fields by default) of every record.
+
+        Fields are returned in the requested order; requested fields that are
+        not part of this layout are returned as ``None``.
+        """
+        stored = {
+            field.name: (position, field, offset, field_struct)
+            for position, (field, offset, field_struct) in enumerate(self._field_structs)
+        }
+        names = list(stored) if field_names is None else parse_fields(field_names)
+
+        readings = []
+        mask_start = _CITY_ID.size
+        for start in range(len(self.header), len(blob) - self.record_size + 1, self.record_size):
+            mask = int.from_bytes(
+                blob[start + mask_start:start + mask_start + self.mask_size], "little")
+            reading: dict[str, Any] = {"city_id": _CITY_ID.unpack_from(blob, start)[0]}
+            for name in names:
+                if name not in stored or not mask & (1 << stored[name][0]):
+                    reading[name] = None
+                    continue
+                _, field, offset, field_struct = stored[name]
+                value = field_struct.unpack_from(blob, start + offset)[0]
+                reading[name] = value / field.scale if field.scale != 1 else value
+            readings.append(reading)
+        return readings
+
+
+def is_legacy_readings(data: Union[str, bytes]) -> bool:
+    """Whether ``data`` holds readings stored as JSON text before the binary layout."""
+    return isinstance(data, str) or bytes(data[:1]) in (b"[", b'"')
+
+
+def upgrade_legacy_readings(data: Union[str, bytes], layout: ReadingLayout) -> bytes:
+    if not is_legacy_readings(data):
+        return data
+    readings = json.loads(data)
+    if isinstance(readings, str):
+        readings = json.loads(readings)
+    return layout.header + b"".join(layout.encode(reading) for reading in readings)